@@ -1,9 +1,27 @@
-from index.agent.agent import Agent
-from index.agent.models import ActionModel, ActionResult, AgentOutput
-from index.browser.browser import Browser, BrowserConfig
-from index.llm.providers.anthropic import AnthropicProvider
-from index.llm.providers.anthropic_bedrock import AnthropicBedrockProvider
-from index.llm.providers.openai import OpenAIProvider
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from index.agent.agent import Agent
+	from index.agent.models import ActionModel, ActionResult, AgentOutput
+	from index.browser.browser import Browser, BrowserConfig
+	from index.llm.providers.anthropic import AnthropicProvider
+	from index.llm.providers.anthropic_bedrock import AnthropicBedrockProvider
+	from index.llm.providers.openai import OpenAIProvider
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package does not pull in every LLM provider SDK up front.
+_LAZY = {
+	'Agent': ('index.agent.agent', 'Agent'),
+	'Browser': ('index.browser.browser', 'Browser'),
+	'BrowserConfig': ('index.browser.browser', 'BrowserConfig'),
+	'ActionResult': ('index.agent.models', 'ActionResult'),
+	'ActionModel': ('index.agent.models', 'ActionModel'),
+	'AnthropicProvider': ('index.llm.providers.anthropic', 'AnthropicProvider'),
+	'AnthropicBedrockProvider': ('index.llm.providers.anthropic_bedrock', 'AnthropicBedrockProvider'),
+	'OpenAIProvider': ('index.llm.providers.openai', 'OpenAIProvider'),
+	'AgentOutput': ('index.agent.models', 'AgentOutput'),
+}
 
 __all__ = [
 	'Agent',
@@ -16,3 +34,16 @@ __all__ = [
 	'OpenAIProvider',
 	'AgentOutput',
 ]
+
+
+def __getattr__(name: str):
+	if name in _LAZY:
+		module_name, attr = _LAZY[name]
+		value = getattr(_import_module(module_name), attr)
+		globals()[name] = value
+		return value
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+	return sorted(set(globals()) | set(_LAZY))
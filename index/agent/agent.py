@@ -310,8 +310,8 @@ class Agent:
 						# if span is None, it implies that we're using the step_span_context
 						ctx = step_span_context.model_dump_json()
 
-					yield TimeoutChunk(
-							content=TimeoutChunkContent(
+					yield TimeoutChunk.build(
+							content=TimeoutChunkContent.build(
 										action_result=result, 
 										summary=summary, 
 										step=step, 
@@ -323,8 +323,8 @@ class Agent:
 					)
 					return
 
-				yield StepChunk(
-						content=StepChunkContent(
+				yield StepChunk.build(
+						content=StepChunkContent.build(
 									action_result=result, 
 									summary=summary, 
 									trace_id=trace_id,
@@ -338,7 +338,7 @@ class Agent:
 
 			if not is_done:
 				logger.info('❌ Maximum number of steps reached')
-				yield StepChunkError(content=f'Maximum number of steps reached: {max_steps}')
+				yield StepChunkError.build(content=f'Maximum number of steps reached: {max_steps}')
 
 
 		except Exception as e:
@@ -363,7 +363,7 @@ class Agent:
 					trace_id=trace_id,
 				)
 
-				yield FinalOutputChunk(content=final_output)
+				yield FinalOutputChunk.build(content=final_output)
 			finally:
 				if span is not None:
 					span.end()
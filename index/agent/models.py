@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Any, Dict, Literal, Optional
 
 from playwright.async_api import StorageState
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from index.llm.llm import Message, ThinkingBlock
 
@@ -46,39 +46,99 @@ class AgentOutput(BaseModel):
 
 class AgentStreamChunk(BaseModel):
 	"""Base class for chunks in the agent stream"""
+	model_config = ConfigDict(extra='forbid', frozen=True)
+
 	type: str
 
 class StepChunkContent(BaseModel):
+	model_config = ConfigDict(extra='forbid', frozen=True)
+
 	action_result: ActionResult
-	summary: str
+	summary: Optional[str] = None
 	trace_id: str | None = None
 	screenshot: Optional[str] = None
 
+	@classmethod
+	def build(
+		cls,
+		action_result: ActionResult,
+		summary: Optional[str],
+		trace_id: str | None = None,
+		screenshot: Optional[str] = None,
+	) -> StepChunkContent:
+		"""Build from already-typed internal values, skipping validation"""
+		return cls.model_construct(
+			action_result=action_result,
+			summary=summary,
+			trace_id=trace_id,
+			screenshot=screenshot,
+		)
+
 class StepChunk(AgentStreamChunk):
 	"""Chunk containing a step result"""
 	type: Literal["step"] = "step"
 	content: StepChunkContent
 
+	@classmethod
+	def build(cls, content: StepChunkContent) -> StepChunk:
+		return cls.model_construct(type="step", content=content)
+
 class TimeoutChunkContent(BaseModel):
+	model_config = ConfigDict(extra='forbid', frozen=True)
+
 	action_result: ActionResult
-	summary: str
+	summary: Optional[str] = None
 	step: int
 	agent_state: AgentState
 	step_parent_span_context: Optional[str]
 	trace_id: str | None = None
 	screenshot: Optional[str] = None
 
+	@classmethod
+	def build(
+		cls,
+		action_result: ActionResult,
+		summary: Optional[str],
+		step: int,
+		agent_state: AgentState,
+		step_parent_span_context: Optional[str],
+		trace_id: str | None = None,
+		screenshot: Optional[str] = None,
+	) -> TimeoutChunkContent:
+		"""Build from already-typed internal values, skipping validation"""
+		return cls.model_construct(
+			action_result=action_result,
+			summary=summary,
+			step=step,
+			agent_state=agent_state,
+			step_parent_span_context=step_parent_span_context,
+			trace_id=trace_id,
+			screenshot=screenshot,
+		)
+
 class TimeoutChunk(AgentStreamChunk):
 	"""Chunk containing a timeout"""
 	type: Literal["step_timeout"] = "step_timeout"
 	content: TimeoutChunkContent
 
+	@classmethod
+	def build(cls, content: TimeoutChunkContent) -> TimeoutChunk:
+		return cls.model_construct(type="step_timeout", content=content)
+
 class StepChunkError(AgentStreamChunk):
 	"""Chunk containing an error"""
 	type: Literal["step_error"] = "step_error"
 	content: str
 
+	@classmethod
+	def build(cls, content: str) -> StepChunkError:
+		return cls.model_construct(type="step_error", content=content)
+
 class FinalOutputChunk(AgentStreamChunk):
 	"""Chunk containing the final output"""
 	type: Literal["final_output"] = "final_output"
 	content: AgentOutput
+
+	@classmethod
+	def build(cls, content: AgentOutput) -> FinalOutputChunk:
+		return cls.model_construct(type="final_output", content=content)
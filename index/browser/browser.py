@@ -18,6 +18,7 @@ from playwright.async_api import (
 from playwright.async_api import (
 	Page,
 	Playwright,
+	Route,
 	StorageState,
 	async_playwright,
 )
@@ -45,6 +46,9 @@ logger = logging.getLogger(__name__)
 
 INTERACTIVE_ELEMENTS_JS_CODE = resources.read_text('index.browser', 'findVisibleInteractiveElements.js')
 
+# Resource types that don't affect interactive elements, skipped when `block_heavy_resources` is enabled
+HEAVY_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'texttrack'})
+
 class ViewportSize(TypedDict):
 	width: int
 	height: int
@@ -70,12 +74,19 @@ class BrowserConfig:
 		sheets_model_endpoint: Optional[str] = None
 			SageMaker endpoint for sheets model, set to None to disable sheets detection
 
+		block_heavy_resources: bool = False
+			Abort requests for images, fonts and media to speed up page loads.
+			Screenshots will not show the blocked content, so leave it disabled for vision-based tasks.
+			Every request is routed through Python to decide this, and routing disables the HTTP cache,
+			so pages whose weight is mostly scripts and styles may load slower with it enabled.
+
 	"""
 	cdp_url: Optional[str] = None
 	viewport_size: ViewportSize = field(default_factory=lambda: {"width": 1200, "height": 900})
 	storage_state: Optional[StorageState] = None
 	cv_model_endpoint: Optional[str] = None
 	sheets_model_endpoint: Optional[str] = None
+	block_heavy_resources: bool = False
 
 class Browser:
 	"""
@@ -169,6 +180,9 @@ class Browser:
 			
 			# Apply anti-detection scripts
 			await self._apply_anti_detection_scripts()
+
+			if self.config.block_heavy_resources:
+				await self.context.route('**/*', self._block_heavy_resources)
 			
 		self.context.on('page', self._on_page_change)	
 
@@ -184,6 +198,13 @@ class Browser:
 		
 		return self
 	
+	async def _block_heavy_resources(self, route: Route):
+		"""Abort requests for resources that are irrelevant to interactive elements"""
+		if route.request.resource_type in HEAVY_RESOURCE_TYPES:
+			await route.abort()
+		else:
+			await route.continue_()
+
 	async def _on_page_change(self, page: Page):
 		"""Handle page change events"""
 		logger.info(f'Current page changed to {page.url}')
@@ -360,6 +381,10 @@ class Browser:
 	
 	async def get_current_page(self) -> Page:
 		"""Get the current page"""
+		if self.current_page is not None and self.current_page.is_closed():
+			# the tab was closed by the page itself, fall back to the most recent open tab
+			self.current_page = self.context.pages[-1] if self.context and self.context.pages else None
+
 		if self.current_page is None:
 			await self._init_browser()
 		return self.current_page
@@ -432,7 +457,7 @@ class Browser:
 		"""Get all interactive elements on the page"""
 		page = await self.get_current_page()	
 		result = await page.evaluate(INTERACTIVE_ELEMENTS_JS_CODE)
-		interactive_elements_data = InteractiveElementsData(**result)
+		interactive_elements_data = InteractiveElementsData.model_validate(result)
 
 		return interactive_elements_data
 	
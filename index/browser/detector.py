@@ -3,17 +3,88 @@ Simple detector module for element detection.
 """
 
 import logging
+import os
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 import random
 
 from lmnr import observe
 
-from index.browser.models import InteractiveElement
+from index.browser.models import Coordinates, InteractiveElement
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Set LMNR_ENABLED=0 (e.g. for benchmark/test runs) to skip span creation entirely
+_TRACING = os.environ.get("LMNR_ENABLED", "1") == "1"
+
+def _maybe_observe(**kwargs):
+    """
+    Apply lmnr's observe decorator only when tracing is enabled.
+    """
+    return observe(**kwargs) if _TRACING else (lambda func: func)
+
+# Mock image size and sheet grid (5x8)
+_IMG_W, _IMG_H = 800, 600
+_SHEET_ROWS, _SHEET_COLS = 5, 8
+
+# Immutable fields that are identical for every mock element
+_BASE_KW = dict(text="", weight=1.0, input_type=None, z_index=0)
+
+@lru_cache(maxsize=8)
+def _build_cells(rows: int, cols: int, width: int, height: int) -> Tuple[Tuple[int, int, int, int], ...]:
+    """
+    Compute rounded (x1, y1, x2, y2) boxes for a rows x cols grid, in row-major order.
+    The grid only depends on its shape, so results are memoized.
+    """
+    # Cell boundaries are shared between neighbours, compute them once
+    xs = [round(col * width / cols) for col in range(cols + 1)]
+    ys = [round(row * height / rows) for row in range(rows + 1)]
+    return tuple(
+        (xs[col], ys[row], xs[col + 1], ys[row + 1])
+        for row in range(rows)
+        for col in range(cols)
+    )
+
+def _make_element(
+    index: int,
+    browser_agent_id: str,
+    tag_name: str,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+    right: int,
+    bottom: int,
+) -> InteractiveElement:
+    """
+    Build a mock InteractiveElement from already-rounded box coordinates.
+    Values are generated internally, so pydantic validation is skipped.
+    """
+    # viewport and page are identical for mock elements, share one instance
+    box = Coordinates.model_construct(x=x, y=y, width=width, height=height)
+    return InteractiveElement.model_construct(
+        index=index,
+        browser_agent_id=browser_agent_id,
+        tag_name=tag_name,
+        viewport=box,
+        page=box,
+        center=Coordinates.model_construct(x=round(x + width/2), y=round(y + height/2)),
+        rect={
+            "left": x,
+            "top": y,
+            "right": right,
+            "bottom": bottom,
+            "width": width,
+            "height": height
+        },
+        # InteractiveElement is mutable, so each element gets its own dict
+        attributes={},
+        **_BASE_KW
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class CVDetection:
     """Computer vision detection result"""
     box: List[float]  # [x1, y1, x2, y2]
@@ -32,7 +103,7 @@ class Detector:
         """
         pass
     
-    @observe(name="detector.detect_from_image", ignore_input=True)
+    @_maybe_observe(name="detector.detect_from_image", ignore_input=True)
     async def detect_from_image(self, image_b64: str, detect_sheets: bool = False) -> List[InteractiveElement]:
         """
         Mock detection from image data - generates sample elements.
@@ -44,155 +115,62 @@ class Detector:
         Returns:
             List of mock InteractiveElement objects
         """
-        if detect_sheets:
-            return await self._generate_sheet_elements()
-        else:
-            return await self._generate_cv_elements()
+        try:
+            if detect_sheets:
+                return self._generate_sheet_elements()
+            else:
+                return self._generate_cv_elements()
+        except Exception as e:
+            logger.error(f"Error generating mock elements: {e}")
+            return []
 
-    async def _generate_cv_elements(self) -> List[InteractiveElement]:
+    def _generate_cv_elements(self) -> List[InteractiveElement]:
         """
         Generate mock CV elements.
         
         Returns:
             List of mock InteractiveElement objects
         """
-        try:
-            # Generate a random number of mock elements (3-8)
-            num_elements = random.randint(3, 8)
-            logger.info(f"Generating {num_elements} mock CV elements")
-            
-            elements = []
-            image_width = 800
-            image_height = 600
-            
-            for i in range(num_elements):
-                # Generate random box dimensions
-                x1 = random.randint(10, image_width - 100)
-                y1 = random.randint(10, image_height - 100)
-                width = random.randint(50, 200)
-                height = random.randint(30, 100)
-                x2 = min(x1 + width, image_width)
-                y2 = min(y1 + height, image_height)
-                
-                # Create unique ID for the CV detection
-                index_id = f"cv-{i}"
-                
-                # Create element
-                element = InteractiveElement(
-                    index=i,
-                    browser_agent_id=index_id,
-                    tag_name="element",
-                    text="",
-                    attributes={},
-                    weight=1,
-                    viewport={
-                        "x": round(x1),
-                        "y": round(y1),
-                        "width": round(width),
-                        "height": round(height)
-                    },
-                    page={
-                        "x": round(x1),
-                        "y": round(y1),
-                        "width": round(width),
-                        "height": round(height)
-                    },
-                    center={
-                        "x": round(x1 + width/2),
-                        "y": round(y1 + height/2)
-                    },
-                    input_type=None,
-                    rect={
-                        "left": round(x1),
-                        "top": round(y1),
-                        "right": round(x2),
-                        "bottom": round(y2),
-                        "width": round(width),
-                        "height": round(height)
-                    },
-                    z_index=0
-                )
-                
-                elements.append(element)
-            
-            logger.info(f"Created {len(elements)} mock interactive elements")
-            return elements
-        except Exception as e:
-            logger.error(f"Error generating mock CV elements: {e}")
-            return []
+        # Generate a random number of mock elements (3-8)
+        num_elements = random.randint(3, 8)
+        logger.info(f"Generating {num_elements} mock CV elements")
+        
+        # Draw all random box dimensions up front, one column per coordinate
+        randint = random.randint
+        xs = [randint(10, _IMG_W - 100) for _ in range(num_elements)]
+        ys = [randint(10, _IMG_H - 100) for _ in range(num_elements)]
+        widths = [randint(50, 200) for _ in range(num_elements)]
+        heights = [randint(30, 100) for _ in range(num_elements)]
+        
+        elements = [
+            _make_element(
+                i, f"cv-{i}", "element", x1, y1, width, height,
+                min(x1 + width, _IMG_W), min(y1 + height, _IMG_H)
+            )
+            for i, (x1, y1, width, height) in enumerate(zip(xs, ys, widths, heights))
+        ]
+        
+        logger.info(f"Created {len(elements)} mock interactive elements")
+        return elements
     
-    async def _generate_sheet_elements(self) -> List[InteractiveElement]:
+    def _generate_sheet_elements(self) -> List[InteractiveElement]:
         """
         Generate mock sheet elements.
         
         Returns:
             List of mock InteractiveElement objects
         """
-        try:
-            # Generate grid-like elements for sheets
-            logger.info("Generating mock sheet elements")
-            
-            elements = []
-            image_width = 800
-            image_height = 600
-            
-            # Create a grid of cells (5x8)
-            rows = 5
-            cols = 8
-            cell_width = image_width / cols
-            cell_height = image_height / rows
-            
-            index = 0
-            for row in range(rows):
-                for col in range(cols):
-                    x1 = col * cell_width
-                    y1 = row * cell_height
-                    x2 = (col + 1) * cell_width
-                    y2 = (row + 1) * cell_height
-                    width = cell_width
-                    height = cell_height
-                    
-                    # Create element
-                    element = InteractiveElement(
-                        index=index,
-                        browser_agent_id=f"cell-{row}-{col}",
-                        tag_name="cell",
-                        text="",
-                        attributes={},
-                        weight=1,
-                        viewport={
-                            "x": round(x1),
-                            "y": round(y1),
-                            "width": round(width),
-                            "height": round(height)
-                        },
-                        page={
-                            "x": round(x1),
-                            "y": round(y1),
-                            "width": round(width),
-                            "height": round(height)
-                        },
-                        center={
-                            "x": round(x1 + width/2),
-                            "y": round(y1 + height/2)
-                        },
-                        input_type=None,
-                        rect={
-                            "left": round(x1),
-                            "top": round(y1),
-                            "right": round(x2),
-                            "bottom": round(y2),
-                            "width": round(width),
-                            "height": round(height)
-                        },
-                        z_index=0
-                    )
-                    
-                    elements.append(element)
-                    index += 1
-            
-            logger.info(f"Created {len(elements)} mock sheet elements")
-            return elements
-        except Exception as e:
-            logger.error(f"Error generating mock sheet elements: {e}")
-            return []
\ No newline at end of file
+        # Generate grid-like elements for sheets
+        logger.info("Generating mock sheet elements")
+        
+        cells = _build_cells(_SHEET_ROWS, _SHEET_COLS, _IMG_W, _IMG_H)
+        elements = [
+            _make_element(
+                index, f"cell-{index // _SHEET_COLS}-{index % _SHEET_COLS}", "cell",
+                x1, y1, x2 - x1, y2 - y1, x2, y2
+            )
+            for index, (x1, y1, x2, y2) in enumerate(cells)
+        ]
+        
+        logger.info(f"Created {len(elements)} mock sheet elements")
+        return elements
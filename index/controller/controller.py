@@ -35,6 +35,7 @@ class Controller:
         self.exclude_actions = exclude_actions or []
         self.output_model = output_model
         self._actions: Dict[str, Action] = {}
+        self._action_descriptions: Optional[str] = None
         
         # Register default actions
         register_default_actions(self, self.output_model)
@@ -74,6 +75,7 @@ class Controller:
                 function=async_wrapper,
                 browser_context=browser_context,
             )
+            self._action_descriptions = None
             return func
 
         return decorator
@@ -125,6 +127,9 @@ class Controller:
 
     def get_action_descriptions(self) -> str:
         """Return a dictionary of all registered actions and their metadata"""
+        if self._action_descriptions is not None:
+            return self._action_descriptions
+
         action_info = []
         
         for name, action in self._actions.items():
@@ -149,4 +154,5 @@ class Controller:
                 'parameters': params
             }, indent=2))
         
-        return '\n\n'.join(action_info)
\ No newline at end of file
+        self._action_descriptions = '\n\n'.join(action_info)
+        return self._action_descriptions
\ No newline at end of file
@@ -1,16 +1,116 @@
 import asyncio
-import json
 import logging
-import platform
 import re
 
-from tenacity import retry, stop_after_attempt, wait_exponential
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from index.agent.models import ActionResult
 from index.browser.browser import Browser
 
 logger = logging.getLogger(__name__)
 
+_NONDIGIT_RE = re.compile(r'\D')
+
+# Playwright resolves ControlOrMeta to Meta on macOS and Control elsewhere
+_SELECT_ALL_KEY = 'ControlOrMeta+a'
+
+# Upper bound on dropdown options echoed back to the LLM, long lists (countries, timezones) dominate the next prompt
+_MAX_LISTED_OPTIONS = 100
+
+# Scrolls what a mouse wheel at the viewport center would scroll: the nearest ancestor of the element
+# there that can still scroll in the direction of dy, or the window if there is none
+_SCROLL_PAGE_JS = """
+(dy) => {
+    let target = document.elementFromPoint(window.innerWidth / 2, window.innerHeight / 2);
+    while (target && target !== document.body && target !== document.documentElement) {
+        const overflowY = getComputedStyle(target).overflowY;
+        const scrollable = overflowY === 'auto' || overflowY === 'scroll' || overflowY === 'overlay';
+        const canMove = dy > 0
+            ? target.scrollTop + target.clientHeight < target.scrollHeight
+            : target.scrollTop > 0;
+        if (scrollable && canMove) {
+            target.scrollBy({ top: dy, behavior: 'instant' });
+            return;
+        }
+        target = target.parentElement;
+    }
+    window.scrollBy({ top: dy, behavior: 'instant' });
+}
+"""
+
+# Clears an editable text input or textarea in one round-trip. The prototype value setter is used
+# so that frameworks tracking the value (e.g. React) see the change. Anything else (contenteditable,
+# readonly or disabled fields) returns false and is cleared with the keyboard instead.
+_CLEAR_ELEMENT_JS = """
+(browserAgentId) => {
+    const element = document.querySelector(`[data-browser-agent-id="${browserAgentId}"]`);
+    const textInputTypes = ['text', 'search', 'email', 'url', 'tel', 'password', 'number'];
+
+    let proto;
+    if (element instanceof HTMLInputElement && textInputTypes.includes(element.type)) {
+        proto = HTMLInputElement.prototype;
+    } else if (element instanceof HTMLTextAreaElement) {
+        proto = HTMLTextAreaElement.prototype;
+    } else {
+        return false;
+    }
+    if (element.readOnly || element.disabled) return false;
+
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(element, '');
+    element.dispatchEvent(new Event('input', { bubbles: true }));
+    element.dispatchEvent(new Event('change', { bubbles: true }));
+    element.focus();
+    return true;
+}
+"""
+
+# Navigation failures that retrying the same URL won't fix
+_NON_RETRYABLE_NAVIGATION_ERRORS = (
+    'net::ERR_ABORTED',
+    'net::ERR_NAME_NOT_RESOLVED',
+    'interrupted by another navigation',
+)
+
+def _is_retryable_navigation_error(e: BaseException) -> bool:
+    """Retry only Playwright errors (including timeouts) that may be transient"""
+    if not isinstance(e, PlaywrightError):
+        return False
+    message = str(e)
+    return not any(error in message for error in _NON_RETRYABLE_NAVIGATION_ERRORS)
+
+async def _wait_for_load_state(page: Page, state: str = 'domcontentloaded', timeout: float = 2000) -> None:
+    """Wait until the page reaches `state`, giving up quietly after `timeout` ms"""
+    try:
+        await page.wait_for_load_state(state, timeout=timeout)
+    except PlaywrightTimeoutError:
+        logger.debug(f'Timed out waiting for {state} after {timeout}ms')
+
+async def _click_at(page: Page, x: float, y: float, hover_first: bool = False) -> None:
+    """Click at (x, y). mouse.click already moves the pointer, so a separate hover is only done on request"""
+    if hover_first:
+        await page.mouse.move(x, y)
+        # give hover-revealed content time to appear
+        await asyncio.sleep(0.1)
+    await page.mouse.click(x, y)
+
+async def _event_fired(event_task: asyncio.Task) -> bool:
+    """Return whether a pre-armed Playwright `wait_for_event` task fired before its timeout"""
+    try:
+        await event_task
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+def _take_fired_event(event_task: asyncio.Task) -> bool:
+    """Return whether a pre-armed `wait_for_event` task has already fired, cancelling it if still pending"""
+    if not event_task.done():
+        event_task.cancel()
+        return False
+    return not event_task.cancelled() and event_task.exception() is None
+
 def register_default_actions(controller, output_model=None):
     """Register all default browser actions to the provided controller"""
 
@@ -42,8 +142,9 @@ def register_default_actions(controller, output_model=None):
 
     @controller.action()
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        stop=stop_after_attempt(2),
+        wait=wait_exponential(multiplier=0.5, min=0.5, max=2),
+        retry=retry_if_exception(_is_retryable_navigation_error),
         reraise=True,
         before_sleep=lambda retry_state: logger.warning(
             f"Retrying step after error: {retry_state.outcome.exception()}. Attempt {retry_state.attempt_number}"
@@ -53,8 +154,7 @@ def register_default_actions(controller, output_model=None):
         """Navigate to URL in the current tab"""
         page = await browser.get_current_page()
         # large timeout for remote browsers
-        await page.goto(url)
-        await asyncio.sleep(2)
+        await page.goto(url, wait_until='domcontentloaded')
         msg = f"Navigated to {url}"
         logger.info(msg)
         return ActionResult(content=msg)
@@ -65,8 +165,6 @@ def register_default_actions(controller, output_model=None):
         try:
             page = await browser.get_current_page()            
             await page.go_back(wait_until='domcontentloaded')
-            # Wait for the page to stabilize
-            await asyncio.sleep(1)
             msg = 'Navigated back to the previous page'
             logger.info(msg)
             return ActionResult(content=msg)
@@ -107,21 +205,23 @@ def register_default_actions(controller, output_model=None):
 
 
     @controller.action()
-    async def click_element(index: int, wait_after_click: bool, browser: Browser):
+    async def click_element(index: int, wait_after_click: bool, browser: Browser, hover_first: bool = False):
         """
         Click on the element with index. 
 
         Args:
             index: Index of the element to click on.
-            wait_after_click: If True, wait for 2 second after clicking the element. Only set it to True when you think that clicking will trigger loading state, for instance navigation to new page, search, loading of a content, etc.
+            wait_after_click: If True, wait up to 2 seconds for the page to settle after clicking the element. Only set it to True when you think that clicking will trigger loading state, for instance navigation to new page, search, loading of a content, etc.
+            hover_first: If True, hover over the element before clicking. Only set it to True when the element only becomes clickable after hovering over it.
         """
         # clean index if it contains any non-numeric characters
-        cleaned_index_str = re.sub(r'\D', '', str(index))
-        if cleaned_index_str == '':
-            logger.error(f'Index is not a number. Index: {index}')
-            return ActionResult(error="`index` should be a valid number.")
-        
-        index = int(cleaned_index_str)
+        if not isinstance(index, int):
+            cleaned_index_str = _NONDIGIT_RE.sub('', str(index))
+            if cleaned_index_str == '':
+                logger.error(f'Index is not a number. Index: {index}')
+                return ActionResult(error="`index` should be a valid number.")
+            
+            index = int(cleaned_index_str)
 
         state = browser.get_state()
 
@@ -129,35 +229,58 @@ def register_default_actions(controller, output_model=None):
             return ActionResult(error=f"Element with index {index} does not exist - retry or use alternative actions.")
 
         element = state.interactive_elements[index]
-        initial_pages = len(browser.context.pages) if browser.context else 0
+        new_page_task = None
+        navigation_task = None
 
         try:
             page = await browser.get_current_page()
 
-            await page.mouse.move(element.center.x, element.center.y)
-            await asyncio.sleep(0.1)
-            await page.mouse.click(element.center.x, element.center.y)
+            # listen for a popup while the click is in flight instead of polling afterwards
+            new_page_task = asyncio.create_task(browser.context.wait_for_event('page', timeout=2000)) if browser.context else None
+            # arm before clicking, a load state check afterwards would see the page that is still loaded
+            navigation_task = asyncio.create_task(page.wait_for_event('domcontentloaded', timeout=2000)) if wait_after_click else None
+
+            await _click_at(page, element.center.x, element.center.y, hover_first)
 
             msg = f'Clicked element with index {index}: <{element.tag_name}></{element.tag_name}>'
 
             logger.info(msg)
-            if browser.context and len(browser.context.pages) > initial_pages:
+            if navigation_task is not None:
+                # wait up to 2 seconds for the click to load a page here or open a new tab
+                pending = [task for task in (navigation_task, new_page_task) if task is not None]
+                await asyncio.wait(pending, timeout=2, return_when=asyncio.FIRST_COMPLETED)
+                _take_fired_event(navigation_task)
+            else:
+                # yield once so an already-dispatched popup event can resolve, without blocking the click
+                await asyncio.sleep(0)
+            if new_page_task is not None and _take_fired_event(new_page_task):
                 new_tab_msg = 'New tab opened - switching to it'
                 msg += f' - {new_tab_msg}'
                 logger.info(new_tab_msg)
                 await browser.switch_to_tab(-1)
-            
-            if wait_after_click:
-                await asyncio.sleep(2)
 
             return ActionResult(content=msg)
         except Exception as e:
+            for task in (new_page_task, navigation_task):
+                if task is not None:
+                    task.cancel()
             return ActionResult(error=str(e))
  
     @controller.action(
-        description='Use this action to wait for the page to load, if you see that the content on the clean screenshot is empty or loading UI elements such as skeleton screens. This action will wait for page to load. Then you can continue with your actions.',
+        description='Use this action to wait for the page to load, if you see that the content on the clean screenshot is empty or loading UI elements such as skeleton screens. This action will wait for page to load. Then you can continue with your actions. Optionally pass `text_to_wait` to wait until that text appears on the page, or `text_gone` to wait until that text (e.g. "Loading...") disappears.',
     )
-    async def wait_for_page_to_load() -> ActionResult:
+    async def wait_for_page_to_load(browser: Browser, text_to_wait: str = '', text_gone: str = '') -> ActionResult:
+        page = await browser.get_current_page()
+        await _wait_for_load_state(page, 'networkidle', timeout=5000)
+
+        try:
+            if text_to_wait:
+                await page.get_by_text(text_to_wait).first.wait_for(state='visible', timeout=5000)
+            if text_gone:
+                await page.get_by_text(text_gone).first.wait_for(state='hidden', timeout=5000)
+        except PlaywrightTimeoutError:
+            return ActionResult(content='Waited for page to load, but the expected text change did not happen within 5 seconds')
+
         return ActionResult(content='Waited for page to load')
 
     @controller.action()
@@ -172,17 +295,22 @@ def register_default_actions(controller, output_model=None):
         try:
             page = await browser.get_current_page()
             # clear the element
-            await page.keyboard.press("ControlOrMeta+a")
-            await asyncio.sleep(0.1)
+            await page.keyboard.press(_SELECT_ALL_KEY)
             await page.keyboard.press("Backspace")
-            await asyncio.sleep(0.1)
 
             # input text into the element
             await page.keyboard.type(text)
 
             if press_enter:
-                await page.keyboard.press("Enter")
-                await asyncio.sleep(2)
+                # arm the listener before pressing Enter so a fast navigation isn't missed,
+                # it resolves as soon as the new document is ready instead of after a fixed delay
+                navigation_task = asyncio.create_task(page.wait_for_event('domcontentloaded', timeout=2000))
+                try:
+                    await page.keyboard.press("Enter")
+                except Exception:
+                    navigation_task.cancel()
+                    raise
+                await _event_fired(navigation_task)
 
             msg = f'Entered "{text}" on the keyboard. Make sure to double check that the text was entered to where you intended.'
             logger.info(msg)
@@ -194,7 +322,6 @@ def register_default_actions(controller, output_model=None):
     @controller.action('Switch tab')
     async def switch_tab(page_id: int, browser: Browser):
         await browser.switch_to_tab(page_id)
-        await asyncio.sleep(0.5)
         msg = f'Switched to tab {page_id}'
         logger.info(msg)
         return ActionResult(content=msg)
@@ -212,12 +339,9 @@ def register_default_actions(controller, output_model=None):
     async def scroll_page_down(browser: Browser):
         page = await browser.get_current_page()
         state = browser.get_state()
-        # move mouse to the center of the page
-        await page.mouse.move(state.viewport.width / 2, state.viewport.height / 2)
-        await asyncio.sleep(0.1)
         # scroll down by one page
-        await page.mouse.wheel(0, state.viewport.height * 0.8)
-        return ActionResult(content="Scrolled mouse wheel down (it doesn't guarantee that something has scrolled, you need to check new state screenshot to confirm)")
+        await page.evaluate(_SCROLL_PAGE_JS, state.viewport.height * 0.8)
+        return ActionResult(content="Scrolled page down (it doesn't guarantee that something has scrolled, you need to check new state screenshot to confirm)")
 
     @controller.action(
         "Scroll entire page up. Use this action when you want to scroll entire page up to load more content. DON'T use this action if you want to scroll over a scrollable element."
@@ -225,12 +349,9 @@ def register_default_actions(controller, output_model=None):
     async def scroll_page_up(browser: Browser):
         page = await browser.get_current_page()
         state = browser.get_state()
-        # move mouse to the center of the page
-        await page.mouse.move(state.viewport.width / 2, state.viewport.height / 2)
-        await asyncio.sleep(0.1)
         # scroll up by one page
-        await page.mouse.wheel(0, -state.viewport.height * 0.8)
-        return ActionResult(content="Scrolled mouse wheel up (it doesn't guarantee that something has scrolled, you need to check new state screenshot to confirm)")
+        await page.evaluate(_SCROLL_PAGE_JS, -state.viewport.height * 0.8)
+        return ActionResult(content="Scrolled page up (it doesn't guarantee that something has scrolled, you need to check new state screenshot to confirm)")
 
     @controller.action(
         "Moves mouse to the element with index `index`, located inside scrollable area of the webpage, identified by scrollbars. Then scrolls mouse wheel down."
@@ -245,7 +366,6 @@ def register_default_actions(controller, output_model=None):
         element = state.interactive_elements[index]
 
         await page.mouse.move(element.center.x, element.center.y)
-        await asyncio.sleep(0.1)
         await page.mouse.wheel(0, state.viewport.height / 3)
 
         return ActionResult(content=f"Move mouse to element with index {index} and scroll mouse wheel down. (It doesn't guarantee that something has scrolled, you need to check new state screenshot to confirm)")
@@ -263,7 +383,6 @@ def register_default_actions(controller, output_model=None):
         element = state.interactive_elements[index]
 
         await page.mouse.move(element.center.x, element.center.y)
-        await asyncio.sleep(0.1)
         await page.mouse.wheel(0, -state.viewport.height / 3)
 
         return ActionResult(content=f"Move mouse to element with index {index} and scroll mouse wheel up. (It doesn't guarantee that something has scrolled, you need to check new state screenshot to confirm)")
@@ -290,16 +409,13 @@ def register_default_actions(controller, output_model=None):
 
         element = state.interactive_elements[index]
 
-        await page.mouse.move(element.center.x, element.center.y)
-        await page.mouse.click(element.center.x, element.center.y)
-        await asyncio.sleep(0.1)
+        if not await page.evaluate(_CLEAR_ELEMENT_JS, element.browser_agent_id):
+            # element is not a plain editable text field in the main document (e.g. contenteditable, CV-detected or
+            # inside shadow DOM), fall back to clearing it with the keyboard
+            await _click_at(page, element.center.x, element.center.y)
+            await page.keyboard.press(_SELECT_ALL_KEY)
+            await page.keyboard.press('Backspace')
 
-        if platform.system() == "Darwin":
-            await page.keyboard.press('Meta+A')
-        else:
-            await page.keyboard.press('Control+A')
-        await asyncio.sleep(0.1)
-        await page.keyboard.press('Backspace')
         return ActionResult(content='Removed all text in the element with index')
 
     @controller.action()
@@ -318,7 +434,7 @@ def register_default_actions(controller, output_model=None):
             element = interactive_elements[index]
             
             # Check if it's a select element
-            if element.tag_name.lower() != 'select':
+            if element.tag_name != 'select':
                 return ActionResult(error=f"Element {index} is not a select element, it's a {element.tag_name}")
             
             # Use the unique ID to find the element
@@ -328,26 +444,23 @@ def register_default_actions(controller, output_model=None):
                 const select = document.querySelector(`[data-browser-agent-id="${args.browserAgentId}"]`);
                 if (!select) return null;
                 
-                // Get all options	
+                // Get options, already formatted one per line
+                const options = Array.from(select.options);
                 return {
-                    options: Array.from(select.options).map(opt => ({
-                        text: opt.text,
-                        value: opt.value,
-                        index: opt.index
-                    })),
+                    formatted: options
+                        .slice(0, args.maxOptions)
+                        .map(opt => opt.index + ': option=' + JSON.stringify(opt.text))
+                        .join('\\n'),
+                    total: options.length,
                     id: select.id,
                     name: select.name
                 };
             }
-            """, {"browserAgentId": element.browser_agent_id})
+            """, {"browserAgentId": element.browser_agent_id, "maxOptions": _MAX_LISTED_OPTIONS})
 
-            # Process options from direct approach
-            formatted_options = []
-            for opt in options_data['options']:
-                encoded_text = json.dumps(opt['text'])
-                formatted_options.append(f'{opt["index"]}: option={encoded_text}')
-                
-            msg = '\n'.join(formatted_options)
+            msg = options_data['formatted']
+            if options_data['total'] > _MAX_LISTED_OPTIONS:
+                msg += f'\n... {options_data["total"] - _MAX_LISTED_OPTIONS} more options'
             msg += '\nIf you decide to use this select element, use the exact option name in select_dropdown_option'
             
             logger.info(f'Found dropdown with ID: {options_data["id"]}, Name: {options_data["name"]}')
@@ -378,88 +491,33 @@ def register_default_actions(controller, output_model=None):
             element = interactive_elements[index]
             
             # Check if it's a select element
-            if element.tag_name.lower() != 'select':
+            if element.tag_name != 'select':
                 return ActionResult(error=f"Element {index} is not a select element, it's a {element.tag_name}")
             
             logger.debug(f"Attempting to select '{option}' using browser_agent_id: {element.browser_agent_id}")
             
-            # Use JavaScript to select the option using the unique ID
-            result = await page.evaluate("""
-            (args) => {
-                const uniqueId = args.uniqueId;
-                const optionText = args.optionText;
-                
-                try {
-                    // Find the select element by unique ID - works across frames too
-                    function findElementByUniqueId(root, id) {
-                        // Check in main document first
-                        let element = document.querySelector(`[data-browser-agent-id="${id}"]`);
-                        if (element) return element;
-                    }
-                    
-                    const select = findElementByUniqueId(window, uniqueId);
-                    if (!select) {
-                        return { 
-                            success: false, 
-                            error: "Select element not found with ID: " + uniqueId 
-                        };
-                    }
-                    
-                    // Find the option with matching text
-                    let found = false;
-                    let selectedValue = null;
-                    let selectedIndex = -1;
-                    
-                    for (let i = 0; i < select.options.length; i++) {
-                        const opt = select.options[i];
-                        if (opt.text === optionText) {
-                            // Select this option
-                            opt.selected = true;
-                            found = true;
-                            selectedValue = opt.value;
-                            selectedIndex = i;
-                            
-                            // Trigger change event
-                            const event = new Event('change', { bubbles: true });
-                            select.dispatchEvent(event);
-                            break;
-                        }
-                    }
-                    
-                    if (found) {
-                        return { 
-                            success: true, 
-                            value: selectedValue, 
-                            index: selectedIndex 
-                        };
-                    } else {
-                        return { 
-                            success: false, 
-                            error: "Option not found: " + optionText,
-                            availableOptions: Array.from(select.options).map(o => o.text)
-                        };
-                    }
-                } catch (e) {
-                    return { 
-                        success: false, 
-                        error: e.toString() 
-                    };
-                }
-            }
-            """, {"uniqueId": element.browser_agent_id, "optionText": option})
+            select = page.locator(f'[data-browser-agent-id="{element.browser_agent_id}"]')
             
-            if result.get('success'):
-                msg = f"Selected option '{option}' with value '{result.get('value')}' at index {result.get('index')}"
-                logger.info(msg)
-                return ActionResult(content=msg)
-            else:
-                error_msg = result.get('error', 'Unknown error')
-                if 'availableOptions' in result:
-                    available = result.get('availableOptions', [])
-                    error_msg += f". Available options: {', '.join(available)}"
-                    
+            # match on option.text, which is what get_select_options shows; `label=` would match option.label
+            option_index = await select.evaluate('(select, text) => Array.from(select.options).findIndex(o => o.text === text)', option, timeout=2000)
+            if option_index == -1:
+                error_msg = f"Option not found: {option}"
+                try:
+                    # only list the available options when the option is missing
+                    available = await select.evaluate('(select) => Array.from(select.options).map(o => o.text)', timeout=2000)
+                    error_msg += f". Available options: {', '.join(available[:_MAX_LISTED_OPTIONS])}"
+                    if len(available) > _MAX_LISTED_OPTIONS:
+                        error_msg += f' ... {len(available) - _MAX_LISTED_OPTIONS} more options'
+                except PlaywrightError as e:
+                    logger.debug(f'Could not list options: {e}')
                 logger.error(f"Selection failed: {error_msg}")
                 return ActionResult(error=error_msg)
+
+            selected_values = await select.select_option(index=option_index, timeout=2000)
+            
+            msg = f"Selected option '{option}' with value '{selected_values[0] if selected_values else ''}'"
+            logger.info(msg)
+            return ActionResult(content=msg)
                 
         except Exception as e:
             msg = f'Selection failed: {str(e)}'